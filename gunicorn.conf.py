@@ -0,0 +1,12 @@
+# Gunicorn settings for serving the app: gunicorn -c gunicorn.conf.py index:app
+#
+# The /predict route spends nearly all of its time waiting on the Gemini API,
+# so gevent workers let each process keep hundreds of requests in flight
+# instead of one per worker.
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:' + os.environ.get('PORT', '8000'))
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', '500'))
+timeout = 60
@@ -0,0 +1,10 @@
+/** @type {import('tailwindcss').Config} */
+module.exports = {
+  // The chat page markup (including classes added from its inline script)
+  // lives in the CHAT_PAGE_HTML literal in index.py.
+  content: ['./index.py'],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+};